@@ -9,5 +9,7 @@ class ContextBuilder:
             "h1": raw.get("h1"),
             "word_count": raw.get("word_count"),
             "internal_links": raw.get("internal_links"),
+            # Counted once here so it can never disagree with the list
+            "internal_link_count": len(raw.get("internal_links") or []),
             "semantic_entities": raw.get("entities", [])
         }
@@ -1,4 +1,9 @@
-from services.crawler import crawl_page
+import asyncio
+import copy
+from collections import defaultdict
+
+from cachetools import TTLCache
+
 from .context_builder import ContextBuilder
 from .data_normalizer import DataNormalizer
 from .issue_detector import IssueDetector
@@ -8,40 +13,87 @@ from .opportunity_scoring import OpportunityScorer
 from .impact_estimator import ImpactEstimator
 from .confidence_calculator import ConfidenceCalculator
 
+# Pipeline stages are stateless, so bind them once at import instead of
+# instantiating every helper on each run.
+_build_context = ContextBuilder().build
+_normalize = DataNormalizer().normalize
+_detect_issues = IssueDetector().detect
+_prioritize_issues = IssuePrioritizer().prioritize
+_detect_opportunities = OpportunityDetector().detect
+_score_opportunities = OpportunityScorer().score
+_estimate_impact = ImpactEstimator().estimate
+_calculate_confidence = ConfidenceCalculator().calculate
+
+_RESULT_CACHE = TTLCache(maxsize=1024, ttl=60)
+
+MAX_CONCURRENT_RUNS_PER_TENANT = 4
+
+
+def new_tenant_slots():
+    # Semaphores bind to the loop that first waits on them, so build this
+    # mapping on the serving loop (see the app lifespan), not at import.
+    return defaultdict(lambda: asyncio.Semaphore(MAX_CONCURRENT_RUNS_PER_TENANT))
+
 
 class AutoSEOEngine:
 
-    def __init__(self, tenant_id: str):
+    def __init__(self, tenant_id: str, crawler, slot: asyncio.Semaphore):
         self.tenant_id = tenant_id
+        self.crawler = crawler
+        self.slot = slot
+
+    async def arun(self, url: str):
+
+        cached = self._cached(url)
+        if cached is not None:
+            return cached
+
+        # 1. Crawl page without blocking the event loop, capped per tenant
+        async with self.slot:
+            # Another run may have filled the cache while we waited
+            cached = self._cached(url)
+            if cached is not None:
+                return cached
+
+            raw = await self.crawler.crawl(url)
+
+            return self._store(url, self._analyze(url, raw))
+
+    def _cached(self, url: str):
+        result = _RESULT_CACHE.get((self.tenant_id, url))
+
+        return copy.deepcopy(result) if result is not None else None
+
+    def _store(self, url: str, result: dict):
+        _RESULT_CACHE[(self.tenant_id, url)] = result
 
-    def run(self, url: str):
+        return copy.deepcopy(result)
 
-        # 1. Crawl page (future full site crawler)
-        raw = crawl_page(url)
+    def _analyze(self, url: str, raw: dict):
 
         # 2. Build semantic context
-        context = ContextBuilder().build(raw)
+        context = _build_context(raw)
 
         # 3. Normalize data
-        data = DataNormalizer().normalize(context)
+        data = _normalize(context)
 
         # 4. Detect issues
-        issues = IssueDetector().detect(data)
+        issues = _detect_issues(data)
 
         # 5. Prioritize issues (impact-based)
-        prioritized = IssuePrioritizer().prioritize(issues)
+        prioritized = _prioritize_issues(issues)
 
         # 6. Detect opportunities (growth paths)
-        opportunities = OpportunityDetector().detect(data)
+        opportunities = _detect_opportunities(data)
 
         # 7. Score opportunities (ROI)
-        scored = OpportunityScorer().score(opportunities)
+        scored = _score_opportunities(opportunities)
 
         # 8. Estimate impact (traffic/SEO gain)
-        impact = ImpactEstimator().estimate(prioritized, scored)
+        impact = _estimate_impact(prioritized, scored)
 
         # 9. Confidence score (data quality)
-        confidence = ConfidenceCalculator().calculate(prioritized, scored)
+        confidence = _calculate_confidence(prioritized, scored)
 
         # 10. Response (AI-ready structure)
         return {
@@ -1,3 +1,31 @@
+_TEMPLATES = {
+    "missing_title": {
+        "type": "missing_title",
+        "severity": "critical",
+        "penalty": 20,
+        "message": "Title is missing"
+    },
+    "short_title": {
+        "type": "short_title",
+        "severity": "high",
+        "penalty": 10,
+        "message": "Title should be 30+ characters"
+    },
+    "missing_meta": {
+        "type": "missing_meta",
+        "severity": "critical",
+        "penalty": 20,
+        "message": "Meta description missing"
+    },
+    "thin_content": {
+        "type": "thin_content",
+        "severity": "medium",
+        "penalty": 15,
+        "message": "Content is thin (<300 words)"
+    },
+}
+
+
 class IssueDetector:
 
     def detect(self, data: dict):
@@ -9,35 +37,15 @@ class IssueDetector:
         word_count = data.get("word_count", 0)
 
         if not title:
-            issues.append({
-                "type": "missing_title",
-                "severity": "critical",
-                "penalty": 20,
-                "message": "Title is missing"
-            })
+            issues.append({**_TEMPLATES["missing_title"]})
 
         if len(title) < 30:
-            issues.append({
-                "type": "short_title",
-                "severity": "high",
-                "penalty": 10,
-                "message": "Title should be 30+ characters"
-            })
+            issues.append({**_TEMPLATES["short_title"]})
 
         if not meta:
-            issues.append({
-                "type": "missing_meta",
-                "severity": "critical",
-                "penalty": 20,
-                "message": "Meta description missing"
-            })
+            issues.append({**_TEMPLATES["missing_meta"]})
 
         if word_count < 300:
-            issues.append({
-                "type": "thin_content",
-                "severity": "medium",
-                "penalty": 15,
-                "message": "Content is thin (<300 words)"
-            })
+            issues.append({**_TEMPLATES["thin_content"]})
 
         return issues
@@ -5,7 +5,7 @@ class OpportunityDetector:
         opportunities = []
 
         word_count = data.get("word_count", 0)
-        internal_links = data.get("internal_links", [])
+        internal_link_count = data.get("internal_link_count", 0)
 
         if word_count > 800:
             opportunities.append({
@@ -14,7 +14,7 @@ class OpportunityDetector:
                 "message": "Good candidate for pillar content strategy"
             })
 
-        if len(internal_links) < 5:
+        if internal_link_count < 5:
             opportunities.append({
                 "type": "internal_linking",
                 "score": 15,
@@ -1,27 +1,67 @@
-from fastapi import FastAPI, Depends
+import asyncio
+from contextlib import asynccontextmanager
+
+import httpx
+from fastapi import FastAPI, Depends, HTTPException, Request
 from core.auth import verify_api_key
-from ai.auto_seo_engine.engine import AutoSEOEngine
+from ai.auto_seo_engine.engine import AutoSEOEngine, new_tenant_slots
 from analyzer import analyze_seo
+from services.crawler import AsyncCrawler, InvalidPageURL
+
+
+def get_crawl_state(app: FastAPI):
+    # Serverless hosts may skip the lifespan or serve each call on a fresh
+    # event loop; the crawler and slots must belong to the running loop.
+    state = app.state
+    loop = asyncio.get_running_loop()
+
+    if getattr(state, "crawl_loop", None) is not loop:
+        state.crawler = AsyncCrawler()
+        state.tenant_slots = new_tenant_slots()
+        state.crawl_loop = loop
+
+    return state
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    state = get_crawl_state(app)
+    try:
+        yield
+    finally:
+        await state.crawler.aclose()
+        state.crawl_loop = None
+
 
-app = FastAPI(title="AutoSEO Service")
+app = FastAPI(title="AutoSEO Service", lifespan=lifespan)
 
 @app.get("/")
-def home():
+def home() -> dict:
     return {"status": "AutoSEO Engine Running"}
 
 @app.post("/analyze")
-def analyze(url: str = None, payload: dict = None, tenant=Depends(verify_api_key)):
+async def analyze(request: Request, url: str = None, payload: dict = None, tenant=Depends(verify_api_key)) -> dict:
     """
     Hybrid mode:
     - url → Auto SEO Engine
     - payload → legacy analyzer
     """
-    engine = AutoSEOEngine(tenant_id=tenant)
+    state = get_crawl_state(request.app)
+    engine = AutoSEOEngine(
+        tenant_id=tenant,
+        crawler=state.crawler,
+        slot=state.tenant_slots[tenant]
+    )
 
     if url:
-        return engine.run(url)
+        try:
+            return await engine.arun(url)
+        except InvalidPageURL as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        except httpx.HTTPError as exc:
+            raise HTTPException(status_code=502, detail=f"Failed to fetch {url}: {exc}")
 
     if payload:
-        return analyze_seo(payload)
+        return await asyncio.to_thread(analyze_seo, payload)
 
     return {"error": "Provide url or payload"}
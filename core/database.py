@@ -1,5 +1,33 @@
-from sqlalchemy import create_engine
+import os
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
-engine = create_engine("sqlite:///autoseo.db")
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///autoseo.db")
+_IS_SQLITE = DATABASE_URL.startswith("sqlite")
+
+if _IS_SQLITE:
+    engine = create_engine(DATABASE_URL, connect_args={"cached_statements": 256})
+else:
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=5,
+        max_overflow=10,
+        pool_pre_ping=True
+    )
+
 SessionLocal = sessionmaker(bind=engine)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.close()
+
+
+if _IS_SQLITE:
+    event.listen(engine, "connect", _set_sqlite_pragmas)
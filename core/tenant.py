@@ -1,4 +1,12 @@
+import threading
+
+
 class Tenant:
+    __slots__ = ("tenant_id", "plan", "limit", "usage")
+
+    # Shared by all tenants: keeps instances small and picklable
+    _usage_lock = threading.Lock()
+
     def __init__(self, tenant_id: str, plan="free", limit=100):
         self.tenant_id = tenant_id
         self.plan = plan
@@ -9,4 +17,13 @@ class Tenant:
         return self.usage < self.limit
 
     def track_usage(self):
-        self.usage += 1
+        with self._usage_lock:
+            self.usage += 1
+
+    def try_consume(self):
+        with self._usage_lock:
+            if self.usage >= self.limit:
+                return False
+
+            self.usage += 1
+            return True
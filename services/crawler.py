@@ -1,9 +1,13 @@
-import requests
+import asyncio
+
+import httpx
 from bs4 import BeautifulSoup
 
-def crawl_page(url: str):
-    response = requests.get(url, timeout=10)
-    soup = BeautifulSoup(response.text, "html.parser")
+MAX_CONCURRENT_FETCHES = 16
+
+
+def _parse_page(html: str):
+    soup = BeautifulSoup(html, "html.parser")
 
     return {
         "title": soup.title.string if soup.title else "",
@@ -11,3 +15,47 @@ def crawl_page(url: str):
         "word_count": len(soup.get_text().split()),
         "internal_links": []
     }
+
+
+class InvalidPageURL(ValueError):
+    pass
+
+
+def check_url(url: str):
+    try:
+        parsed = httpx.URL(url)
+    except httpx.InvalidURL as exc:
+        raise InvalidPageURL(f"Invalid URL {url!r}: {exc}") from exc
+
+    if parsed.scheme not in ("http", "https") or not parsed.host:
+        raise InvalidPageURL(f"Invalid URL {url!r}: expected an absolute http(s) URL")
+
+
+# The pooled client and semaphore bind to the event loop that first uses them,
+# so create and close an AsyncCrawler on the loop that serves requests.
+class AsyncCrawler:
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_FETCHES, transport=None):
+        self._client = httpx.AsyncClient(
+            timeout=10,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=64),
+            transport=transport
+        )
+        self._fetch_slots = asyncio.Semaphore(max_concurrent)
+
+    async def crawl(self, url: str):
+        # Reject caller mistakes before they surface as transport errors
+        check_url(url)
+
+        async with self._fetch_slots:
+            response = await self._client.get(url)
+
+        # Never analyze (and cache) an error page as if it were the real one
+        response.raise_for_status()
+
+        # html.parser is pure Python; keep it off the event loop
+        return await asyncio.to_thread(_parse_page, response.text)
+
+    async def aclose(self):
+        await self._client.aclose()
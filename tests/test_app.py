@@ -0,0 +1,82 @@
+import functools
+import importlib
+import sys
+import types
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from ai.auto_seo_engine import engine as engine_module
+from services.crawler import AsyncCrawler
+
+HEADERS = {"x-api-key": "cashog-key"}
+PAGE = "<html><head><title>A page title that is long enough</title></head><body>hi</body></html>"
+
+
+def handler(request):
+    if request.url.host == "down.example":
+        raise httpx.ConnectError("connection refused", request=request)
+    if request.url.path == "/missing":
+        return httpx.Response(404, text="not found")
+    return httpx.Response(200, text=PAGE)
+
+
+@pytest.fixture
+def app(monkeypatch):
+    # The legacy analyzer module that api/app.py imports is not in this tree
+    legacy = types.ModuleType("analyzer")
+    legacy.analyze_seo = lambda payload: {"legacy": payload}
+    monkeypatch.setitem(sys.modules, "analyzer", legacy)
+
+    app_module = importlib.import_module("api.app")
+    monkeypatch.setattr(
+        app_module,
+        "AsyncCrawler",
+        functools.partial(AsyncCrawler, transport=httpx.MockTransport(handler))
+    )
+    engine_module._RESULT_CACHE.clear()
+
+    yield app_module.app
+
+    engine_module._RESULT_CACHE.clear()
+
+
+def analyze(client, url):
+    return client.post("/analyze", params={"url": url}, headers=HEADERS)
+
+
+def test_analyze_url(app):
+    with TestClient(app) as client:
+        response = analyze(client, "https://ok.example/")
+
+    assert response.status_code == 200
+    assert response.json()["url"] == "https://ok.example/"
+
+
+@pytest.mark.parametrize("url", ["http://[::1", "notaurl", "ftp://ok.example/", "https://"])
+def test_invalid_url_is_a_client_error(app, url):
+    with TestClient(app) as client:
+        response = analyze(client, url)
+
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("url", ["https://down.example/", "https://ok.example/missing"])
+def test_fetch_failure_is_a_bad_gateway(app, url):
+    with TestClient(app) as client:
+        response = analyze(client, url)
+
+    assert response.status_code == 502
+
+
+def test_analyze_without_lifespan(app):
+    # Outside the context manager TestClient sends no lifespan events and
+    # runs each request on its own event loop, like a serverless host.
+    client = TestClient(app)
+
+    first = analyze(client, "https://ok.example/a")
+    second = analyze(client, "https://ok.example/b")
+
+    assert first.status_code == 200
+    assert second.status_code == 200
@@ -0,0 +1,19 @@
+from ai.auto_seo_engine.context_builder import ContextBuilder
+from ai.auto_seo_engine.opportunity_detector import OpportunityDetector
+
+
+def opportunity_types(raw):
+    data = ContextBuilder().build(raw)
+    return {o["type"] for o in OpportunityDetector().detect(data)}
+
+
+def test_internal_link_count_follows_the_list():
+    links = [f"/page-{i}" for i in range(6)]
+
+    assert ContextBuilder().build({"internal_links": links})["internal_link_count"] == 6
+    assert "internal_linking" not in opportunity_types({"internal_links": links, "word_count": 0})
+
+
+def test_missing_links_count_as_zero():
+    assert ContextBuilder().build({})["internal_link_count"] == 0
+    assert "internal_linking" in opportunity_types({"word_count": 0})
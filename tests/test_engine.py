@@ -0,0 +1,104 @@
+import asyncio
+
+import httpx
+import pytest
+
+from ai.auto_seo_engine import engine as engine_module
+from ai.auto_seo_engine.engine import AutoSEOEngine, new_tenant_slots
+from services.crawler import AsyncCrawler
+
+PAGE = "<html><head><title>A page title that is long enough</title></head><body>hi</body></html>"
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    engine_module._RESULT_CACHE.clear()
+    yield
+    engine_module._RESULT_CACHE.clear()
+
+
+def make_transport(hits, status=200):
+
+    async def handler(request):
+        hits.append(str(request.url))
+        # Yield so that concurrent runs actually overlap on the semaphores
+        await asyncio.sleep(0)
+        return httpx.Response(status, text=PAGE)
+
+    return httpx.MockTransport(handler)
+
+
+async def run_many(urls, hits, tenant="t1", status=200, max_concurrent=2):
+    crawler = AsyncCrawler(max_concurrent=max_concurrent, transport=make_transport(hits, status))
+    slots = new_tenant_slots()
+    try:
+        return await asyncio.gather(*(
+            AutoSEOEngine(tenant, crawler=crawler, slot=slots[tenant]).arun(url)
+            for url in urls
+        ))
+    finally:
+        await crawler.aclose()
+
+
+def test_cache_miss_then_hit():
+    hits = []
+
+    first, = asyncio.run(run_many(["https://example.com/"], hits))
+    second, = asyncio.run(run_many(["https://example.com/"], hits))
+
+    assert len(hits) == 1
+    assert first == second
+    assert first["url"] == "https://example.com/"
+
+
+def test_cached_result_is_not_shared():
+    hits = []
+
+    first, = asyncio.run(run_many(["https://example.com/"], hits))
+    first["issues"].clear()
+    second, = asyncio.run(run_many(["https://example.com/"], hits))
+
+    assert second["issues"]
+
+
+def test_cache_is_keyed_by_tenant():
+    hits = []
+
+    asyncio.run(run_many(["https://example.com/"], hits, tenant="t1"))
+    asyncio.run(run_many(["https://example.com/"], hits, tenant="t2"))
+
+    assert len(hits) == 2
+
+
+def test_concurrent_runs_across_event_loops():
+    hits = []
+
+    # Ten runs against 2 fetch slots and 4 tenant slots force contention;
+    # doing it on two separate loops catches loop-bound primitives.
+    first = asyncio.run(run_many([f"https://example.com/{i}" for i in range(10)], hits))
+    second = asyncio.run(run_many([f"https://example.com/b{i}" for i in range(10)], hits))
+
+    assert len(first) == len(second) == 10
+    assert len(hits) == 20
+
+
+def test_concurrent_runs_for_same_url_reuse_result():
+    hits = []
+
+    results = asyncio.run(run_many(["https://example.com/"] * 10, hits))
+
+    assert len(results) == 10
+    # Only the runs that were already past the cache check when the slot
+    # opened (at most MAX_CONCURRENT_RUNS_PER_TENANT) reach the network.
+    assert len(hits) <= engine_module.MAX_CONCURRENT_RUNS_PER_TENANT
+
+
+def test_error_responses_are_not_cached():
+    hits = []
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(run_many(["https://example.com/"], hits, status=503))
+
+    asyncio.run(run_many(["https://example.com/"], hits))
+
+    assert len(hits) == 2
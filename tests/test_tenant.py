@@ -0,0 +1,32 @@
+import copy
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+from core.tenant import Tenant
+
+
+def test_try_consume_stops_at_limit():
+    tenant = Tenant("a", limit=2)
+
+    assert tenant.try_consume()
+    assert tenant.try_consume()
+    assert not tenant.try_consume()
+    assert tenant.usage == 2
+
+
+def test_try_consume_is_atomic_across_threads():
+    tenant = Tenant("a", limit=100)
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        granted = sum(ex.map(lambda _: tenant.try_consume(), range(500)))
+
+    assert granted == 100
+    assert tenant.usage == 100
+
+
+def test_tenant_can_be_copied_and_pickled():
+    tenant = Tenant("a", plan="pro", limit=10)
+    tenant.track_usage()
+
+    for clone in (copy.deepcopy(tenant), pickle.loads(pickle.dumps(tenant))):
+        assert (clone.tenant_id, clone.plan, clone.limit, clone.usage) == ("a", "pro", 10, 1)